@@ -2207,13 +2207,13 @@ def moment(a, moment=1, axis=0):
         # Starting point for exponentiation by squares
         a_zero_mean = a - ma.expand_dims(a.mean(axis), axis)
         if n_list[-1] == 1:
-            s = a_zero_mean.copy()
+            s = a_zero_mean
         else:
-            s = a_zero_mean**2
+            s = a_zero_mean * a_zero_mean
 
         # Perform multiplications
         for n in n_list[-2::-1]:
-            s = s**2
+            s = s * s
             if n % 2:
                 s *= a_zero_mean
         return s.mean(axis)
@@ -166,7 +166,7 @@ References
 import warnings
 import math
 from math import gcd
-from collections import namedtuple
+from collections import namedtuple, Counter
 
 import numpy as np
 from numpy import array, asarray, ma
@@ -493,9 +493,10 @@ def mode(a, axis=0, nan_policy='propagate'):
     ----------
     a : array_like
         n-dimensional array of which to find mode(s).
-    axis : int or None, optional
-        Axis along which to operate. Default is 0. If None, compute over
-        the whole array `a`.
+    axis : int, tuple of ints or None, optional
+        Axis or axes along which to operate. Default is 0. If a tuple of
+        ints, the mode is computed over all of those axes at once. If None,
+        compute over the whole array `a`.
     nan_policy : {'propagate', 'raise', 'omit'}, optional
         Defines how to handle when input contains nan.
         The following options are available (default is 'propagate'):
@@ -528,6 +529,9 @@ def mode(a, axis=0, nan_policy='propagate'):
     ModeResult(mode=array([3]), count=array([3]))
 
     """
+    if isinstance(axis, tuple):
+        return _mode_axes(np.asarray(a), axis, nan_policy)
+
     a, axis = _chk_asarray(a, axis)
     if a.size == 0:
         return ModeResult(np.array([]), np.array([]))
@@ -556,6 +560,17 @@ def mode(a, axis=0, nan_policy='propagate'):
         return ModeResult(mostfrequent, oldcounts)
 
     def _mode1D(a):
+        if a.dtype == object:
+            # Counting by hash needs only __eq__ and __hash__, and avoids the
+            # Python-level comparisons np.unique makes to sort the objects.
+            try:
+                cnts = Counter(a)
+            except TypeError:
+                # unhashable objects; fall back to sorting
+                pass
+            else:
+                cnt = max(cnts.values())
+                return min(v for v, c in cnts.items() if c == cnt), cnt
         vals, cnts = np.unique(a, return_counts=True)
         return vals[cnts.argmax()], cnts.max()
 
@@ -565,6 +580,25 @@ def mode(a, axis=0, nan_policy='propagate'):
     in_dims = list(range(a.ndim))
     a_view = np.transpose(a, in_dims[:axis] + in_dims[axis+1:] + [axis])
 
+    if a.dtype.kind in 'iu' and np.can_cast(a.dtype, np.intp):
+        # For integers spanning a range no wider than the reduction axis,
+        # count every slice with a single bincount instead of sorting each
+        # slice with np.unique.  argmax picks the smallest of tied modes.
+        amin = a.min()
+        span = int(a.max()) - int(amin) + 1
+        if span <= a_view.shape[-1]:
+            nslices = a_view.size // a_view.shape[-1]
+            offsets = np.arange(nslices, dtype=np.intp) * span
+            bins = (a_view.reshape(nslices, -1).astype(np.intp) - amin
+                    + offsets[:, np.newaxis])
+            counts = np.bincount(bins.ravel(), minlength=nslices*span)
+            counts = counts.reshape(nslices, span)
+            modes = (counts.argmax(axis=1) + amin).astype(a.dtype)
+            newshape = list(a.shape)
+            newshape[axis] = 1
+            return ModeResult(modes.reshape(newshape),
+                              counts.max(axis=1).reshape(newshape))
+
     inds = np.ndindex(a_view.shape[:-1])
     modes = np.empty(a_view.shape[:-1], dtype=a.dtype)
     counts = np.zeros(a_view.shape[:-1], dtype=np.int_)
@@ -575,6 +609,26 @@ def mode(a, axis=0, nan_policy='propagate'):
     return ModeResult(modes.reshape(newshape), counts.reshape(newshape))
 
 
+def _mode_axes(a, axes, nan_policy):
+    # `mode` over several axes: move them to the end, merge them into one
+    # axis, and reduce that axis in a single call.  The reduced axes are
+    # kept with length one, as `mode` does for a single axis.
+    axes = [np.core.multiarray.normalize_axis_index(ax, a.ndim)
+            for ax in axes]
+    if len(set(axes)) != len(axes):
+        raise ValueError("repeated axis in `axis` argument")
+    keep = [i for i in range(a.ndim) if i not in axes]
+    merged = np.transpose(a, keep + axes)
+    merged = merged.reshape(merged.shape[:len(keep)]
+                            + (int(np.prod([a.shape[i] for i in axes])),))
+    res = mode(merged, axis=len(keep), nan_policy=nan_policy)
+    if res.mode.size == 0:
+        return res
+    outshape = [1 if i in axes else n for i, n in enumerate(a.shape)]
+    return ModeResult(res.mode.reshape(outshape),
+                      res.count.reshape(outshape))
+
+
 def _mask_to_limits(a, limits, inclusive):
     """Mask an array for values outside of given limits.
 
@@ -1036,13 +1090,15 @@ def moment(a, moment=1, axis=0, nan_policy='propagate'):
 
     # for array_like moment input, return a value for each.
     if not np.isscalar(moment):
-        mmnt = [_moment(a, i, axis) for i in moment]
+        # the mean is shared by every order, so compute it only once
+        mean = a.mean(axis, keepdims=True)
+        mmnt = [_moment(a, i, axis, mean=mean) for i in moment]
         return np.array(mmnt)
     else:
         return _moment(a, moment, axis)
 
 
-def _moment(a, moment, axis):
+def _moment(a, moment, axis, *, mean=None):
     if np.abs(moment - np.round(moment)) > 0:
         raise ValueError("All moment parameters must be integers")
 
@@ -1079,15 +1135,17 @@ def _moment(a, moment, axis):
             n_list.append(current_n)
 
         # Starting point for exponentiation by squares
-        a_zero_mean = a - np.expand_dims(np.mean(a, axis), axis)
+        mean = a.mean(axis, keepdims=True) if mean is None else mean
+        a_zero_mean = a - mean
         if n_list[-1] == 1:
-            s = a_zero_mean.copy()
+            # No copy: the loop below rebinds `s` before multiplying in place.
+            s = a_zero_mean
         else:
-            s = a_zero_mean**2
+            s = a_zero_mean * a_zero_mean
 
         # Perform multiplications
         for n in n_list[-2::-1]:
-            s = s**2
+            s = s * s
             if n % 2:
                 s *= a_zero_mean
         return np.mean(s, axis)
@@ -1141,7 +1199,13 @@ def variation(a, axis=0, nan_policy='propagate'):
         a = ma.masked_invalid(a)
         return mstats_basic.variation(a, axis)
 
-    return a.std(axis) / a.mean(axis)
+    mean = a.mean(axis, keepdims=True)
+    if np.iscomplexobj(a):
+        # `_moment` squares the deviations rather than their moduli.
+        std = a.std(axis)
+    else:
+        std = np.sqrt(_moment(a, 2, axis, mean=mean))
+    return std / np.squeeze(mean, axis)
 
 
 def skew(a, axis=0, bias=True, nan_policy='propagate'):
@@ -1229,6 +1293,11 @@ def skew(a, axis=0, bias=True, nan_policy='propagate'):
 
     m2 = moment(a, 2, axis)
     m3 = moment(a, 3, axis)
+    return _skew_from_moments(m2, m3, n, bias)
+
+
+def _skew_from_moments(m2, m3, n, bias):
+    # Sample skewness from the 2nd and 3rd central moments of `n` points.
     zero = (m2 == 0)
     vals = _lazywhere(~zero, (m2, m3),
                       lambda m2, m3: m3 / m2**1.5,
@@ -1339,6 +1408,11 @@ def kurtosis(a, axis=0, fisher=True, bias=True, nan_policy='propagate'):
     n = a.shape[axis]
     m2 = moment(a, 2, axis)
     m4 = moment(a, 4, axis)
+    return _kurtosis_from_moments(m2, m4, n, fisher, bias)
+
+
+def _kurtosis_from_moments(m2, m4, n, fisher, bias):
+    # Sample kurtosis from the 2nd and 4th central moments of `n` points.
     zero = (m2 == 0)
     with np.errstate(all='ignore'):
         vals = np.where(zero, 0, m4 / m2**2.0)
@@ -1437,8 +1511,13 @@ def describe(a, axis=0, ddof=1, bias=True, nan_policy='propagate'):
     mm = (np.min(a, axis=axis), np.max(a, axis=axis))
     m = np.mean(a, axis=axis)
     v = np.var(a, axis=axis, ddof=ddof)
-    sk = skew(a, axis, bias=bias)
-    kurt = kurtosis(a, axis, bias=bias)
+    # Reuse the mean for all the central moments, rather than having skew
+    # and kurtosis compute it again for each moment.
+    mean = np.expand_dims(m, axis)
+    m2 = _moment(a, 2, axis, mean=mean)
+    sk = _skew_from_moments(m2, _moment(a, 3, axis, mean=mean), n, bias)
+    kurt = _kurtosis_from_moments(m2, _moment(a, 4, axis, mean=mean), n,
+                                  True, bias)
 
     return DescribeResult(n, mm, m, v, sk, kurt)
 
@@ -1745,11 +1824,11 @@ def jarque_bera(x):
     >>> x = np.random.normal(0, 1, 100000)
     >>> jarque_bera_test = stats.jarque_bera(x)
     >>> jarque_bera_test
-    Jarque_beraResult(statistic=4.716570798957913, pvalue=0.0945822550304295)
+    Jarque_beraResult(statistic=4.716570798957895, pvalue=0.09458225503043027)
     >>> jarque_bera_test.statistic
-    4.716570798957913
+    4.716570798957895
     >>> jarque_bera_test.pvalue
-    0.0945822550304295
+    0.09458225503043027
 
     """
     x = np.asarray(x)
@@ -1757,10 +1836,17 @@ def jarque_bera(x):
     if n == 0:
         raise ValueError('At least one observation is required.')
 
+    # `np.dot` below accumulates in the input precision without pairwise
+    # summation, so work in at least float64.
+    x = x.astype(np.result_type(x, np.float64), copy=False)
     mu = x.mean()
-    diffx = x - mu
-    skewness = (1 / n * np.sum(diffx**3)) / (1 / n * np.sum(diffx**2))**(3 / 2.)
-    kurtosis = (1 / n * np.sum(diffx**4)) / (1 / n * np.sum(diffx**2))**2
+    diffx = (x - mu).ravel()
+    # Square the deviations once and reuse them for all three moments; the
+    # third and fourth are dot products, so they need no temporaries.
+    diffx2 = diffx * diffx
+    m2 = np.mean(diffx2)
+    skewness = (np.dot(diffx2, diffx) / n) / m2**(3 / 2.)
+    kurtosis = (np.dot(diffx2, diffx2) / n) / m2**2
     jb_value = n / 6 * (skewness**2 + (kurtosis - 3)**2 / 4)
     p = 1 - distributions.chi2.cdf(jb_value, 2)
 
@@ -1810,8 +1896,7 @@ array([[ 0. ,  2. ],
        [ 0.4,  1. ],
        [ 0.5,  1. ]])
 """
-    items, inv = np.unique(a, return_inverse=True)
-    freq = np.bincount(inv)
+    items, freq = np.unique(a, return_counts=True)
     return np.array([items, freq]).T
 
 
@@ -2497,7 +2582,10 @@ def zscore(a, axis=0, ddof=0, nan_policy='propagate'):
         mns = a.mean(axis=axis, keepdims=True)
         sstd = a.std(axis=axis, ddof=ddof, keepdims=True)
 
-    return (a - mns) / sstd
+    # Divide in place so that only one full-size temporary is allocated
+    z = a - mns
+    z /= sstd
+    return z
 
 
 def zmap(scores, compare, axis=0, ddof=0):
@@ -2546,7 +2634,9 @@ def zmap(scores, compare, axis=0, ddof=0):
     scores, compare = map(np.asanyarray, [scores, compare])
     mns = compare.mean(axis=axis, keepdims=True)
     sstd = compare.std(axis=axis, ddof=ddof, keepdims=True)
-    return (scores - mns) / sstd
+    z = scores - mns
+    z /= sstd
+    return z
 
 
 def gstd(a, axis=0, ddof=1):
@@ -2871,7 +2961,7 @@ def _mad_1d(x, center, nan_policy):
         return np.nan
     # Edge cases have been handled, so do the basic MAD calculation.
     med = center(x)
-    mad = np.median(np.abs(x - med))
+    mad = np.median(np.abs(x - med), overwrite_input=True)
     return mad
 
 
@@ -3018,12 +3108,14 @@ def median_abs_deviation(x, axis=0, center=np.median, scale=1.0,
     else:
         if axis is None:
             med = center(x, axis=None)
-            mad = np.median(np.abs(x - med))
+            mad = np.median(np.abs(x - med), overwrite_input=True)
         else:
             # Wrap the call to center() in expand_dims() so it acts like
             # keepdims=True was used.
             med = np.expand_dims(center(x, axis=axis), axis)
-            mad = np.median(np.abs(x - med), axis=axis)
+            # The absolute deviations are a temporary, so let median
+            # partition them in place rather than copying them first.
+            mad = np.median(np.abs(x - med), axis=axis, overwrite_input=True)
 
     return mad / scale
 
@@ -6500,33 +6592,39 @@ def _count_paths_outside_method(m, n, g, h):
     # xj holds the list of x values to be checked.
     # Wherever n*x/m + ng*h crosses an integer
     lxj = n + (mg-h)//mg
-    xj = [(h + mg * j + ng-1)//ng for j in range(lxj)]
     # B is an array just holding a few values of B(x,y), the ones needed.
     # B[j] == B(x_j, j)
     if lxj == 0:
         return np.round(special.binom(m + n, n))
+    jrange = np.arange(lxj)
+    xj = (h + mg * jrange + ng-1)//ng
     B = np.zeros(lxj)
     B[0] = 1
     # Compute the B(x, y) terms
     # The binomial coefficient is an integer, but special.binom() may return a float.
     # Round it to the nearest integer.
+    # The binomials for each row are computed in one call, but the terms
+    # are still subtracted one at a time, in order, as Python floats, so
+    # the rounding is the same as for a term-by-term evaluation.
     for j in range(1, lxj):
         Bj = np.round(special.binom(xj[j] + j, j))
         if not np.isfinite(Bj):
             raise FloatingPointError()
-        for i in range(j):
-            bin = np.round(special.binom(xj[j] - xj[i] + j - i, j-i))
-            Bj -= bin * B[i]
+        bins = np.round(special.binom(xj[j] - xj[:j] + j - jrange[:j],
+                                      j - jrange[:j]))
+        for bin, Bi in zip(bins.tolist(), B[:j].tolist()):
+            Bj -= bin * Bi
         B[j] = Bj
         if not np.isfinite(Bj):
             raise FloatingPointError()
     # Compute the number of path extensions...
+    with np.errstate(over='ignore'):
+        terms = B * np.round(special.binom((m - xj) + (n - jrange),
+                                           n - jrange))
+    if not np.all(np.isfinite(terms)):
+        raise FloatingPointError()
     num_paths = 0
-    for j in range(lxj):
-        bin = np.round(special.binom((m-xj[j]) + (n - j), n-j))
-        term = B[j] * bin
-        if not np.isfinite(term):
-            raise FloatingPointError()
+    for term in terms.tolist():
         num_paths += term
     return np.round(num_paths)
 
@@ -6577,6 +6675,56 @@ def _attempt_exact_2kssamp(n1, n2, g, d, alternative):
     return True, d, prob
 
 
+def _ks_2samp_cdf_extremes(small, large):
+    """Largest differences between the ECDFs of two sorted samples.
+
+    Returns ``(max(F_small - F_large), max(F_large - F_small))``.
+
+    F_small - F_large can only increase at a jump of F_small, and
+    F_large - F_small can only increase between two consecutive jumps of
+    F_small, so both maxima are found by looking at the points of `small`
+    only: from the right for the first, and from the left for the second.
+    This needs O(k log m) work for sample sizes k <= m, instead of
+    evaluating both ECDFs at all k + m points.
+    """
+    k = small.shape[0]
+    m = large.shape[0]
+    # using searchsorted solves equal data problem
+    cdf_small = np.searchsorted(small, small, side='right') / k
+    cdf_large = np.searchsorted(large, small, side='right') / m
+    d_small = np.max(cdf_small - cdf_large)
+    cdf_small = np.searchsorted(small, small, side='left') / k
+    cdf_large = np.searchsorted(large, small, side='left') / m
+    d_large = np.max(cdf_large - cdf_small)
+    return d_small, d_large
+
+
+def _ks_2samp_int_cdf_extremes(data1, data2):
+    """ECDF difference extremes for sorted integer samples with a small range.
+
+    Returns ``(max(F1 - F2), max(F2 - F1))``, or None if the samples are not
+    integers spanning at most ``n1 + n2`` values.  In that case both ECDFs
+    are tabulated over the whole range with np.bincount and np.cumsum,
+    which is cheaper than searching for every observation.
+    """
+    if not (data1.dtype.kind in 'iu' and data2.dtype.kind in 'iu'
+            and np.can_cast(data1.dtype, np.intp)
+            and np.can_cast(data2.dtype, np.intp)):
+        return None
+    n1 = data1.shape[0]
+    n2 = data2.shape[0]
+    lo = min(int(data1[0]), int(data2[0]))
+    span = max(int(data1[-1]), int(data2[-1])) - lo + 1
+    if span > n1 + n2:
+        return None
+    cdf1 = np.cumsum(np.bincount(data1.astype(np.intp) - lo,
+                                 minlength=span)) / n1
+    cdf2 = np.cumsum(np.bincount(data2.astype(np.intp) - lo,
+                                 minlength=span)) / n2
+    cddiffs = cdf1 - cdf2
+    return np.max(cddiffs), -np.min(cddiffs)
+
+
 def ks_2samp(data1, data2, alternative='two-sided', mode='auto'):
     """
     Compute the Kolmogorov-Smirnov statistic on 2 samples.
@@ -6685,25 +6833,29 @@ def ks_2samp(data1, data2, alternative='two-sided', mode='auto'):
        alternative.lower()[0], alternative)
     if alternative not in ['two-sided', 'less', 'greater']:
         raise ValueError(f'Invalid value for alternative: {alternative}')
-    MAX_AUTO_N = 10000  # 'auto' will attempt to be exact if n1,n2 <= MAX_AUTO_N
     if np.ma.is_masked(data1):
         data1 = data1.compressed()
     if np.ma.is_masked(data2):
         data2 = data2.compressed()
-    data1 = np.sort(data1)
-    data2 = np.sort(data2)
+    return _ks_2samp_sorted(np.sort(data1), np.sort(data2), alternative, mode)
+
+
+def _ks_2samp_sorted(data1, data2, alternative, mode):
+    # Body of ks_2samp for data that are already sorted, with `alternative`
+    # and `mode` already validated.
+    MAX_AUTO_N = 10000  # 'auto' will attempt to be exact if n1,n2 <= MAX_AUTO_N
     n1 = data1.shape[0]
     n2 = data2.shape[0]
     if min(n1, n2) == 0:
         raise ValueError('Data passed to ks_2samp must not be empty')
 
-    data_all = np.concatenate([data1, data2])
-    # using searchsorted solves equal data problem
-    cdf1 = np.searchsorted(data1, data_all, side='right') / n1
-    cdf2 = np.searchsorted(data2, data_all, side='right') / n2
-    cddiffs = cdf1 - cdf2
-    minS = -np.min(cddiffs)
-    maxS = np.max(cddiffs)
+    extremes = _ks_2samp_int_cdf_extremes(data1, data2)
+    if extremes is not None:
+        maxS, minS = extremes
+    elif n1 <= n2:
+        maxS, minS = _ks_2samp_cdf_extremes(data1, data2)
+    else:
+        minS, maxS = _ks_2samp_cdf_extremes(data2, data1)
     alt2Dvalue = {'less': minS, 'greater': maxS, 'two-sided': max(minS, maxS)}
     d = alt2Dvalue[alternative]
     g = gcd(n1, n2)